@@ -11,10 +11,9 @@ from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
-from .api import SGSmartApiClient
+from .api import SGSmartApiClient, get_shared_session
 from .const import DOMAIN, LOGGER
 from .coordinator import BlueprintDataUpdateCoordinator
 from .data import IntegrationBlueprintData
@@ -45,7 +44,7 @@ async def async_setup_entry(
         client=SGSmartApiClient(
             username=entry.data[CONF_USERNAME],
             password=entry.data[CONF_PASSWORD],
-            session=async_get_clientsession(hass),
+            session=get_shared_session(hass),
         ),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
@@ -65,7 +64,12 @@ async def async_unload_entry(
     entry: IntegrationBlueprintConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded:
+        # Close the client's pooled WebSockets so the connections and
+        # their reader tasks don't outlive the entry
+        await entry.runtime_data.client.async_close()
+    return unloaded
 
 
 async def async_reload_entry(
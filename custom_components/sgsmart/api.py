@@ -2,14 +2,40 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import socket
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
-import async_timeout
+import orjson
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 
-from .const import BASE_URL, LOGGER, LOGIN_ENDPOINT, DEVICE_ENDPOINT, ROUTE_URL
+from .const import BASE_URL, DOMAIN, LOGGER, LOGIN_ENDPOINT, DEVICE_ENDPOINT, ROUTE_URL
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event, HomeAssistant
+
+# Granular timeouts so a DNS blip fails fast instead of eating the
+# whole request budget
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5, sock_read=8)
+
+# Commands issued within this window are coalesced into one batched
+# WebSocket write (e.g. a scene toggling several bulbs at once).
+BATCH_WINDOW_SECONDS = 0.010
+
+# Valid brightness range for dim commands, in percent
+MIN_BRIGHTNESS_PCT = 1
+MAX_BRIGHTNESS_PCT = 100
+
+# Device command payloads, pre-encoded so sends skip the per-command
+# UTF-8 encode (the payloads are ASCII hex). The dim commands are
+# precomputed for every brightness percentage so the hot path is a
+# plain tuple lookup instead of string formatting per command.
+_TURN_ON_CMD = b"23BC0100010000"
+_TURN_OFF_CMD = b"23BC0000010000"
+# No idea what the "01" suffix means, might be something with sequence.
+# For now always use 01
+_DIM_CMDS = tuple(f"23BC01{i:02X}010000".encode() for i in range(101))
 
 
 class SGSmartApiClientError(Exception):
@@ -28,6 +54,49 @@ class SGSmartApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+def _validate_brightness_percent(brightness_percent: int) -> None:
+    """Validate that a brightness percentage is within the device range."""
+    if not MIN_BRIGHTNESS_PCT <= brightness_percent <= MAX_BRIGHTNESS_PCT:
+        msg = f"Brightness must be between 1 and 100, got {brightness_percent}"
+        raise SGSmartApiClientError(msg)
+
+
+def _orjson_serialize(data: Any) -> str:
+    """Serialize request payloads with orjson for aiohttp."""
+    return orjson.dumps(data).decode()
+
+
+def get_shared_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """
+    Return the long-lived ClientSession shared by all SG Smart clients.
+
+    One session with a tuned connection pool avoids repeated TCP + TLS
+    handshakes to the SG Smart cloud across config entries. The session
+    is closed when Home Assistant stops.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session = domain_data.get("session")
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=30,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            cookie_jar=aiohttp.CookieJar(),
+            json_serialize=_orjson_serialize,
+        )
+        domain_data["session"] = session
+
+        async def _async_close_session(_event: Event) -> None:
+            await session.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_session)
+    return session
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
     if response.status in (401, 403):
@@ -53,6 +122,14 @@ class SGSmartApiClient:
         self._session = session
         self._base_url = BASE_URL
         self._is_authenticated = False
+        self._login_lock = asyncio.Lock()
+        self._ws_pool: dict[str, aiohttp.ClientWebSocketResponse] = {}
+        self._ws_connect_locks: dict[str, asyncio.Lock] = {}
+        self._ws_reader_tasks: set[asyncio.Task] = set()
+        self._pending_commands: dict[str, list[bytes]] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._msg_prefix_cache: dict[tuple[str, int], bytes] = {}
+        self._ws_url_cache: dict[tuple[str, str], str] = {}
 
     async def async_login(self) -> dict[str, Any]:
         """Login to SG Smart service using cookie-based authentication."""
@@ -79,8 +156,14 @@ class SGSmartApiClient:
 
     async def _ensure_authenticated(self) -> None:
         """Ensure the client is authenticated, login if necessary."""
-        if not self._is_authenticated:
-            await self.async_login()
+        if self._is_authenticated:
+            return
+
+        # Single-flight: concurrent callers wait for one login instead
+        # of racing their own POSTs and overwriting each other's cookies
+        async with self._login_lock:
+            if not self._is_authenticated:
+                await self.async_login()
 
     async def _api_call_with_auth(
         self,
@@ -102,7 +185,7 @@ class SGSmartApiClient:
         except SGSmartApiClientAuthenticationError:
             # Authentication failed, try to re-login once
             self._is_authenticated = False
-            await self.async_login()
+            await self._ensure_authenticated()
             return await self._api_wrapper(
                 method=method,
                 url=url,
@@ -140,14 +223,103 @@ class SGSmartApiClient:
             headers={"Content-Type": "application/json"},
         )
 
+    async def _get_ws(self, ws_url: str) -> aiohttp.ClientWebSocketResponse:
+        """Return a long-lived WebSocket for the URL, reconnecting if closed."""
+        ws = self._ws_pool.get(ws_url)
+        if ws is not None and not ws.closed:
+            return ws
+
+        # Serialize connection setup per URL so two concurrent flushes
+        # can't both connect and silently leak one of the sockets
+        lock = self._ws_connect_locks.setdefault(ws_url, asyncio.Lock())
+        async with lock:
+            ws = self._ws_pool.get(ws_url)
+            if ws is not None and not ws.closed:
+                return ws
+
+            # compress=0 skips permessage-deflate negotiation (pointless
+            # zlib work for 14-byte hex commands) and autoclose=False
+            # keeps the connection alive across idle periods
+            ws = await self._session.ws_connect(
+                ws_url,
+                heartbeat=25,
+                autoping=True,
+                compress=0,
+                autoclose=False,
+                max_msg_size=0,
+            )
+            self._ws_pool[ws_url] = ws
+
+            # One reader per connection drains incoming frames so
+            # commands never have to wait for a server round-trip.
+            task = asyncio.create_task(self._ws_reader(ws_url, ws))
+            self._ws_reader_tasks.add(task)
+            task.add_done_callback(self._ws_reader_tasks.discard)
+            return ws
+
+    def _enqueue_command(self, ws_url: str, message_with_type: bytes) -> None:
+        """Queue a command; the first one in a window schedules the flush."""
+        pending = self._pending_commands.setdefault(ws_url, [])
+        pending.append(message_with_type)
+        if len(pending) == 1:
+            task = asyncio.create_task(self._flush_commands(ws_url))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_commands(self, ws_url: str) -> None:
+        """Send all commands queued for a URL as one batched write."""
+        await asyncio.sleep(BATCH_WINDOW_SECONDS)
+        batch = self._pending_commands.pop(ws_url, [])
+        if not batch:
+            return
+
+        try:
+            await self._send_batch(ws_url, batch)
+        except (aiohttp.ClientError, OSError, TimeoutError):
+            # The pooled connection may have gone stale while idle -
+            # reconnect once and retry the batch before giving up
+            self._ws_pool.pop(ws_url, None)
+            try:
+                await self._send_batch(ws_url, batch)
+            except (aiohttp.ClientError, OSError, TimeoutError):
+                self._ws_pool.pop(ws_url, None)
+                LOGGER.exception("Failed to send %d queued command(s)", len(batch))
+
+    async def _send_batch(self, ws_url: str, batch: list[bytes]) -> None:
+        """Write a batch of commands to the (possibly new) connection."""
+        ws = await self._get_ws(ws_url)
+        for message in batch:
+            # Socket.IO is a text protocol, so the pre-encoded bytes
+            # must still go out as TEXT frames
+            await ws.send_frame(message, aiohttp.WSMsgType.TEXT)
+
+    async def _ws_reader(
+        self, ws_url: str, ws: aiohttp.ClientWebSocketResponse
+    ) -> None:
+        """Drain frames from a cached WebSocket in the background."""
+        async for msg in ws:
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                LOGGER.debug("WebSocket message: %s", msg.data)
+                self._parse_websocket_message(msg.data)
+            elif msg.type == aiohttp.WSMsgType.ERROR:
+                LOGGER.warning("WebSocket error: %s", ws.exception())
+                break
+
+        # The loop ending means the server ended the conversation. With
+        # autoclose disabled the socket is not flagged closed, so evict
+        # it from the pool and close it; the next send reconnects.
+        if self._ws_pool.get(ws_url) is ws:
+            self._ws_pool.pop(ws_url, None)
+        await ws.close()
+
     async def async_control_device_websocket(
         self,
         control_url_data: dict[str, Any],
         sector_uuid: str,
         mesh_id: int,
-        command_data: str,
-    ) -> dict[str, Any] | None:
-        """Send control command to device via WebSocket."""
+        command_data: bytes,
+    ) -> None:
+        """Send control command to device via WebSocket (fire-and-forget)."""
         if (
             not control_url_data
             or "host" not in control_url_data
@@ -156,56 +328,36 @@ class SGSmartApiClient:
             msg = "Invalid control URL data"
             raise SGSmartApiClientError(msg)
 
-        # Construct WebSocket URL
-        ws_url = f"{control_url_data['host']}{control_url_data['path']}/socket.io/?EIO=3&transport=websocket"
-        # Convert http/https to ws/wss
-        ws_url = ws_url.replace("https://", "wss://").replace("http://", "ws://")
-
-        # Prepare WebSocket message
-        message = [
-            "extModelMessage",
-            f"s_{sector_uuid.lower()}",
-            mesh_id,
-            65283,
-            command_data,
-        ]
-        # Prepend 42 to indicate message type
-        message_json = json.dumps(message)
-        message_with_type = f"42{message_json}"
-        try:
-            #             # Use proxy and ignore SSL certificate verification
-            # connector = aiohttp.TCPConnector(
-            #     verify_ssl=False,
-            #     force_close=True,
-            # )
-            # proxy_url = "http://host.docker.internal:8080"
-
-            # # Create a new session with the custom connector for WebSocket
-            # async with (
-            #     aiohttp.ClientSession(connector=connector) as ws_session,
-            #     ws_session.ws_connect(
-            #         ws_url,
-            #         proxy=proxy_url,
-            #         ssl=False,
-            #     ) as ws,
-            # ):
-
-            async with self._session.ws_connect(ws_url) as ws:
-                await ws.send_str(message_with_type)
-
-                # Wait for response
-                async for msg in ws:
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        LOGGER.info("WebSocket response: %s", msg.data)
-                        return self._parse_websocket_message(msg.data)
-                    if msg.type == aiohttp.WSMsgType.ERROR:
-                        msg_error = f"WebSocket error: {ws.exception()}"
-                        raise SGSmartApiClientCommunicationError(msg_error)
-        except Exception as exception:
-            msg = f"WebSocket communication error: {exception}"
-            raise SGSmartApiClientCommunicationError(msg) from exception
-
-        return None
+        # Construct WebSocket URL (http/https becomes ws/wss). The
+        # scheme is fixed per host, so cache the rewritten URL.
+        host = control_url_data["host"]
+        path = control_url_data["path"]
+        ws_url = self._ws_url_cache.get((host, path))
+        if ws_url is None:
+            scheme_host = (
+                "wss://" + host[8:]
+                if host.startswith("https://")
+                else "ws://" + host.removeprefix("http://")
+            )
+            ws_url = f"{scheme_host}{path}/socket.io/?EIO=3&transport=websocket"
+            self._ws_url_cache[(host, path)] = ws_url
+
+        # Prepare WebSocket message. The "42" prefix indicates the
+        # Socket.IO message type; everything but the command payload is
+        # fixed per (sector, mesh), so cache the encoded prefix.
+        cache_key = (sector_uuid, mesh_id)
+        prefix = self._msg_prefix_cache.get(cache_key)
+        if prefix is None:
+            prefix = (
+                '42["extModelMessage","s_'
+                + sector_uuid.lower()
+                + '",'
+                + str(mesh_id)
+                + ',65283,"'
+            ).encode()
+            self._msg_prefix_cache[cache_key] = prefix
+
+        self._enqueue_command(ws_url, prefix + command_data + b'"]')
 
     def _parse_websocket_message(self, data: str) -> dict[str, Any] | None:
         """Parse WebSocket message and extract device status."""
@@ -213,14 +365,14 @@ class SGSmartApiClient:
             # WebSocket responses typically start with a number prefix (like "42")
             if data.startswith("42"):
                 json_data = data[2:]  # Remove the "42" prefix
-                parsed = json.loads(json_data)
+                parsed = orjson.loads(json_data)
                 return {"type": "message", "data": parsed}
             if data.startswith("40"):
                 return {"type": "connect", "data": None}
             if data.startswith("41"):
                 return {"type": "disconnect", "data": None}
             return {"type": "unknown", "data": data}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             LOGGER.warning("Failed to parse WebSocket response: %s", data)
             return {"type": "error", "data": data}
 
@@ -231,14 +383,11 @@ class SGSmartApiClient:
         mesh_id: int,
     ) -> None:
         """Turn on a light."""
-        # Using the provided example command for turning on
-        command_data = "23BC0100010000"
-
         await self.async_control_device_websocket(
             control_url_data=control_url_data,
             sector_uuid=sector_uuid,
             mesh_id=mesh_id,
-            command_data=command_data,
+            command_data=_TURN_ON_CMD,
         )
 
     async def async_turn_off_light(
@@ -248,14 +397,11 @@ class SGSmartApiClient:
         mesh_id: int,
     ) -> None:
         """Turn off a light."""
-        # Turn-off command (may need adjustment based on actual protocol)
-        command_data = "23BC0000010000"
-
         await self.async_control_device_websocket(
             control_url_data=control_url_data,
             sector_uuid=sector_uuid,
             mesh_id=mesh_id,
-            command_data=command_data,
+            command_data=_TURN_OFF_CMD,
         )
 
     async def async_dim_light(
@@ -266,48 +412,72 @@ class SGSmartApiClient:
         brightness_percent: int,
     ) -> None:
         """Dim a light to a specific brightness percentage (1-100)."""
-        if not 1 <= brightness_percent <= 100:
-            msg = f"Brightness must be between 1 and 100, got {brightness_percent}"
-            raise SGSmartApiClientError(msg)
-
-        # Convert percentage to hex
-        brightness_hex = f"{brightness_percent:02X}"
-
-        # No idea what the suffix means, might be something with sequence.
-        # For now always use 01
-        suffix = "01"
-
-        # Construct command: 23BC01[brightness_hex][suffix]0000
-        command_data = f"23BC01{brightness_hex}{suffix}0000"
+        _validate_brightness_percent(brightness_percent)
 
         await self.async_control_device_websocket(
             control_url_data=control_url_data,
             sector_uuid=sector_uuid,
             mesh_id=mesh_id,
-            command_data=command_data,
+            command_data=_DIM_CMDS[brightness_percent],
         )
 
+    async def async_set_scene(
+        self,
+        control_url_data: dict[str, Any],
+        sector_uuid: str,
+        levels: dict[int, int],
+    ) -> None:
+        """
+        Dim several devices at once; levels maps mesh_id to percent.
+
+        All commands are queued synchronously so they land in the same
+        batch window and go out as one coalesced write.
+        """
+        for brightness_percent in levels.values():
+            _validate_brightness_percent(brightness_percent)
+
+        for mesh_id, brightness_percent in levels.items():
+            await self.async_control_device_websocket(
+                control_url_data=control_url_data,
+                sector_uuid=sector_uuid,
+                mesh_id=mesh_id,
+                command_data=_DIM_CMDS[brightness_percent],
+            )
+
     async def async_get_device_status(
         self,
         control_url_data: dict[str, Any],
         sector_uuid: str,
         mesh_id: int,
-    ) -> dict[str, Any] | None:
-        """Get current status of a device via WebSocket."""
+    ) -> None:
+        """Request device status via WebSocket; the reader logs the reply."""
         # Status request command - placeholder, needs actual protocol command
-        status_command = "23BD000000000"
+        status_command = b"23BD000000000"
 
-        response = await self.async_control_device_websocket(
+        await self.async_control_device_websocket(
             control_url_data=control_url_data,
             sector_uuid=sector_uuid,
             mesh_id=mesh_id,
             command_data=status_command,
         )
 
-        return response
+    async def async_close(self) -> None:
+        """Close pooled WebSocket connections and their reader tasks."""
+        # Cancel pending flushes first so a command queued just before
+        # close can't reconnect and repopulate the orphaned pool
+        for task in self._flush_tasks:
+            task.cancel()
+        self._flush_tasks.clear()
+        self._pending_commands.clear()
+
+        for ws in self._ws_pool.values():
+            await ws.close()
+        self._ws_pool.clear()
 
     async def async_logout(self) -> None:
         """Logout from SG Smart service by clearing cookies."""
+        await self.async_close()
+
         # Clear cookies from the session
         self._session.cookie_jar.clear()
         self._is_authenticated = False
@@ -321,28 +491,25 @@ class SGSmartApiClient:
     ) -> Any:
         """Get information from the API."""
         try:
-            async with async_timeout.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data,
-                )
-                _verify_response_or_raise(response)
-                return await response.json()
+            response = await self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=data,
+                timeout=_REQUEST_TIMEOUT,
+            )
+            _verify_response_or_raise(response)
+            return await response.json(loads=orjson.loads)
 
         except TimeoutError as exception:
-            msg = f"Timeout error fetching information - {exception}"
+            # Keep the messages static; the chained cause carries the
+            # details without formatting a string on every failure
+            msg = "Timeout error fetching information"
             raise SGSmartApiClientCommunicationError(
                 msg,
             ) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
-            msg = f"Error fetching information - {exception}"
+            msg = "Error fetching information"
             raise SGSmartApiClientCommunicationError(
                 msg,
             ) from exception
-        except Exception as exception:  # pylint: disable=broad-except
-            msg = f"Something really wrong happened! - {exception}"
-            raise SGSmartApiClientError(
-                msg,
-            ) from exception
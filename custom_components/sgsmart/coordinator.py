@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.exceptions import ConfigEntryAuthFailed
@@ -15,6 +17,9 @@ from .api import (
 if TYPE_CHECKING:
     from .data import IntegrationBlueprintConfigEntry
 
+# Control URLs are static routing metadata; refetch at most once an hour
+CONTROL_URLS_TTL_SECONDS = 3600
+
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
 class BlueprintDataUpdateCoordinator(DataUpdateCoordinator):
@@ -22,13 +27,39 @@ class BlueprintDataUpdateCoordinator(DataUpdateCoordinator):
 
     config_entry: IntegrationBlueprintConfigEntry
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self._control_urls_cache: dict[str, tuple[float, Any]] = {}
+        self._last_sector_uuid: str | None = None
+
+    async def _async_get_control_urls(self, sector_uuid: str) -> Any:
+        """Get control URLs for a sector, cached with a TTL."""
+        cached = self._control_urls_cache.get(sector_uuid)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < CONTROL_URLS_TTL_SECONDS:
+            return cached[1]
+
+        client = self.config_entry.runtime_data.client
+        control_data = await client.async_get_control_urls(sector_uuid)
+        self._control_urls_cache[sector_uuid] = (now, control_data)
+        return control_data
+
     async def _async_update_data(self) -> Any:
         """Update data via library."""
         try:
-            # First get the device data
-            device_data = (
-                await self.config_entry.runtime_data.client.async_get_devices()
-            )
+            client = self.config_entry.runtime_data.client
+
+            # Sector UUIDs are stable, so after the first cycle both
+            # fetches can overlap instead of running back to back.
+            if self._last_sector_uuid is not None:
+                device_data, control_data = await asyncio.gather(
+                    client.async_get_devices(),
+                    self._async_get_control_urls(self._last_sector_uuid),
+                )
+            else:
+                device_data = await client.async_get_devices()
+                control_data = None
 
             # Extract sectors and get control URLs for the first sector
             if device_data and "sectors" in device_data:
@@ -36,16 +67,27 @@ class BlueprintDataUpdateCoordinator(DataUpdateCoordinator):
                 if isinstance(sectors, list) and len(sectors) > 0:
                     first_sector_uuid = sectors[0].get("uuid")
                     if first_sector_uuid:
-                        # Get control URLs for the first sector
-                        client = self.config_entry.runtime_data.client
-                        control_data = await client.async_get_control_urls(
-                            first_sector_uuid
-                        )
+                        if first_sector_uuid != self._last_sector_uuid:
+                            # First cycle or sector changed - fetch serially
+                            control_data = await self._async_get_control_urls(
+                                first_sector_uuid
+                            )
+                        self._last_sector_uuid = first_sector_uuid
                         # Merge control data with device data if needed
                         if control_data:
                             device_data["control_urls"] = control_data
 
+            if device_data:
+                # Index devices by uuid so entity lookups avoid a linear
+                # scan of the device list on every property read
+                device_data["_by_uuid"] = {
+                    device["uuid"]: device
+                    for device in device_data.get("devices", [])
+                    if isinstance(device, dict) and "uuid" in device
+                }
+
         except SGSmartApiClientAuthenticationError as exception:
+            self._control_urls_cache.clear()
             raise ConfigEntryAuthFailed(exception) from exception
         except SGSmartApiClientError as exception:
             raise UpdateFailed(exception) from exception
@@ -48,7 +48,7 @@ class SGSmartDeviceEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
         super().__init__(coordinator)
         self._device_uuid = device_uuid
         self._device_data = device_data
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{device_uuid}"
+        self._attr_unique_id = coordinator.config_entry.entry_id + "_" + device_uuid
 
         # Create device info for this specific device
         device_name = device_data.get("name", f"SG Smart Device {device_uuid}")
@@ -68,17 +68,12 @@ class SGSmartDeviceEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
     @property
     def device_data(self) -> dict[str, Any] | None:
         """Get current device data from coordinator."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        # Find this device in the coordinator data
-        devices = self.coordinator.data.get("devices", [])
-        if isinstance(devices, list):
-            for device in devices:
-                if isinstance(device, dict) and device.get("uuid") == self._device_uuid:
-                    return device
-
-        return None
+        # The coordinator indexes devices by uuid on every update
+        return data.get("_by_uuid", {}).get(self._device_uuid)
 
     @property
     def available(self) -> bool:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -10,6 +11,7 @@ from homeassistant.components.light import (
     LightEntityDescription,
 )
 from homeassistant.components.light.const import ColorMode
+from homeassistant.core import callback
 
 from .api import SGSmartApiClientError
 from .entity import SGSmartDeviceEntity
@@ -23,9 +25,22 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Commands are fire-and-forget writes on a shared WebSocket, so let
+# Home Assistant dispatch entity service calls concurrently
+PARALLEL_UPDATES = 0
+
 # Constants for SG Smart dimmer devices
 DEVICE_TYPE_DIMMER = 1  # Type 1 devices are dimmers based on JSON data
 
+# A slider drag fires many brightness updates in quick succession; only
+# the latest value within this window is actually sent
+DIM_DEBOUNCE_SECONDS = 0.08
+
+# Home Assistant brightness (0-255) to device percentage (1-100)
+_BRIGHTNESS_TO_PCT: tuple[int, ...] = tuple(
+    max(1, (brightness * 100) // 255) for brightness in range(256)
+)
+
 # Light description for dimmer devices
 DIMMER_LIGHT_DESCRIPTION = LightEntityDescription(
     key="dimmer",
@@ -42,28 +57,25 @@ async def async_setup_entry(
     """Set up the light platform for SG Smart dimmer devices."""
     coordinator = entry.runtime_data.coordinator
 
-    # Add dimmer light entities for type 1 devices
-    device_entities = []
-    if coordinator.data and "devices" in coordinator.data:
-        devices = coordinator.data["devices"]
-        if isinstance(devices, list):
-            for device in devices:
-                if isinstance(device, dict) and "uuid" in device:
-                    device_uuid = device["uuid"]
-                    device_type = device.get("type")
-
-                    # Only create light entities for type 1 (dimmer) devices
-                    if device_type == DEVICE_TYPE_DIMMER:
-                        device_entities.append(
-                            SGSmartDimmerLight(
-                                coordinator=coordinator,
-                                device_uuid=device_uuid,
-                                device_data=device,
-                                entity_description=DIMMER_LIGHT_DESCRIPTION,
-                            )
-                        )
-
-    async_add_entities(device_entities)
+    # Add dimmer light entities for type 1 (dimmer) devices, streamed
+    # as a generator so no intermediate list is materialized
+    devices = (coordinator.data or {}).get("devices") or ()
+    async_add_entities(
+        (
+            SGSmartDimmerLight(
+                coordinator=coordinator,
+                device_uuid=device["uuid"],
+                device_data=device,
+            )
+            for device in devices
+            if isinstance(device, dict)
+            and device.get("type") == DEVICE_TYPE_DIMMER
+            and "uuid" in device
+        ),
+        # State comes from the coordinator refresh that already ran, so
+        # no per-entity update is needed before adding
+        update_before_add=False,
+    )
 
 
 class SGSmartDimmerLight(SGSmartDeviceEntity, LightEntity):
@@ -72,117 +84,181 @@ class SGSmartDimmerLight(SGSmartDeviceEntity, LightEntity):
     _attr_color_mode = ColorMode.BRIGHTNESS
     _attr_supported_color_modes: ClassVar[set[ColorMode]] = {ColorMode.BRIGHTNESS}
 
+    # Identical for every dimmer, so shared at class scope instead of
+    # stored per instance
+    entity_description = DIMMER_LIGHT_DESCRIPTION
+
     def __init__(
         self,
         coordinator: BlueprintDataUpdateCoordinator,
         device_uuid: str,
         device_data: dict[str, Any],
-        entity_description: LightEntityDescription,
     ) -> None:
         """Initialize the dimmer light class."""
         super().__init__(coordinator, device_uuid, device_data)
-        self.entity_description = entity_description
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{device_uuid}_{entity_description.key}"
-        device_name = device_data.get("name", f"Dimmer {device_uuid}")
-        self._attr_name = f"{device_name}"
+        self._attr_unique_id = (
+            coordinator.config_entry.entry_id
+            + "_"
+            + device_uuid
+            + "_"
+            + DIMMER_LIGHT_DESCRIPTION.key
+        )
+        self._attr_name = device_data.get("name", f"Dimmer {device_uuid}")
+        # mesh_id and sector_uuid are immutable per device
+        self._mesh_id: int | None = device_data.get("mesh_id")
+        self._sector_uuid: str | None = device_data.get("sector_uuid")
+        self._control_urls: dict[str, Any] | None = None
+        self._cached_is_on = False
+        self._cached_brightness: int | None = None
+        self._pending_brightness: int | None = None
+        self._dim_task: asyncio.Task | None = None
+        self._refresh_cached_state()
+
+    def _refresh_cached_state(self) -> None:
+        """Recompute cached on/brightness state from coordinator data."""
+        self._control_urls = (self.coordinator.data or {}).get("control_urls")
+
+        device_data = self.device_data
+        if not device_data:
+            self._cached_is_on = False
+            self._cached_brightness = None
+            return
+
+        # A single status read drives both cached values
+        status = device_data.get("status") or 0
+        self._cached_is_on = status > 0
+        if status <= 0:
+            self._cached_brightness = None
+            return
+
+        min_level = device_data.get("min_level", 10)
+        max_level = device_data.get("max_level", 100)
+        level = device_data.get("start_up_level", 30)
+        level_range = max_level - min_level
+        self._cached_brightness = (
+            int((level - min_level) * 255 / level_range) if level_range > 0 else 128
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached state when the coordinator has new data."""
+        self._refresh_cached_state()
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool:
         """Return true if dimmer is on."""
-
-        if not self.device_data:
-            return False
-
-        return self.device_data.get("on", False)
+        return self._cached_is_on
 
     @property
     def brightness(self) -> int | None:
         """Return the brightness of this light between 1..255."""
-        device_data = self.device_data
-        if not device_data:
+        return self._cached_brightness
+
+    def _get_command_ctx(self) -> tuple[int, str, dict[str, Any]] | None:
+        """Return (mesh_id, sector_uuid, control_urls), or None if not ready."""
+        if not self.device_data:
             return None
 
-        return device_data.get("brightness", 128)
+        mesh_id = self._mesh_id
+        sector_uuid = self._sector_uuid
+        control_urls = self._control_urls
+        if not (mesh_id and sector_uuid and control_urls):
+            return None
+
+        return mesh_id, sector_uuid, control_urls
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the dimmer."""
-        device_data = self.device_data
-        if not device_data:
+        ctx = self._get_command_ctx()
+        if ctx is None:
             return
-
-        # Get control URL data from coordinator
-        if self.coordinator.data:
-            control_urls = self.coordinator.data.get("control_urls")
+        mesh_id, sector_uuid, control_urls = ctx
+
+        # Check if brightness is specified in kwargs
+        brightness = kwargs.get("brightness")
+        if brightness is not None:
+            # Debounce slider drags: remember the latest value and let a
+            # single task send it once the burst settles
+            self._pending_brightness = brightness
+            if self._dim_task is None or self._dim_task.done():
+                self._dim_task = asyncio.create_task(self._flush_dim())
         else:
-            control_urls = None
-        if not control_urls:
-            return
-
-        # Get device info needed for WebSocket control
-        mesh_id = device_data.get("mesh_id")
-        sector_uuid = device_data.get("sector_uuid")
-
-        if mesh_id and sector_uuid:
-            try:
-                client = self.coordinator.config_entry.runtime_data.client
-
-                # Check if brightness is specified in kwargs
-                brightness = kwargs.get("brightness")
-                if brightness is not None:
-                    # Convert Home Assistant brightness (0-255) to percentage (1-100)
-                    brightness_percent = max(1, int((brightness / 255) * 100))
-                    await client.async_dim_light(
-                        control_url_data=control_urls,
-                        sector_uuid=sector_uuid,
-                        mesh_id=mesh_id,
-                        brightness_percent=brightness_percent,
-                    )
-                else:
-                    # No brightness specified, just turn on
-                    await client.async_turn_on_light(
-                        control_url_data=control_urls,
-                        sector_uuid=sector_uuid,
-                        mesh_id=mesh_id,
-                    )
-
-                if self.device_data:
-                    self.device_data["on"] = True
-                    self.device_data["brightness"] = brightness or 255
-                    self.async_schedule_update_ha_state()
-
-            except SGSmartApiClientError as exc:
-                _LOGGER.warning("Failed to turn on light %s: %s", self._attr_name, exc)
-
-    async def async_turn_off(self, **_: Any) -> None:
-        """Turn off the dimmer."""
-        device_data = self.device_data
-        if not device_data:
-            return
-
-        # Get control URL data from coordinator
-        if self.coordinator.data:
-            control_urls = self.coordinator.data.get("control_urls")
-        else:
-            control_urls = None
-        if not control_urls:
-            return
-
-        # Get device info needed for WebSocket control
-        mesh_id = device_data.get("mesh_id")
-        sector_uuid = device_data.get("sector_uuid")
-
-        if mesh_id and sector_uuid:
             try:
                 client = self.coordinator.config_entry.runtime_data.client
-                await client.async_turn_off_light(
+                # No brightness specified, just turn on
+                await client.async_turn_on_light(
                     control_url_data=control_urls,
                     sector_uuid=sector_uuid,
                     mesh_id=mesh_id,
                 )
             except SGSmartApiClientError as exc:
-                _LOGGER.warning("Failed to turn off light %s: %s", self._attr_name, exc)
+                _LOGGER.warning("Failed to turn on light %s: %s", self._attr_name, exc)
+                return
 
-        await self.coordinator.async_request_refresh()
+        # Optimistic update so the UI stays responsive. No await happens
+        # between the mutation and the write, so the synchronous
+        # async_write_ha_state avoids scheduling a task per command.
+        if self.device_data:
+            self.device_data["on"] = True
+            self.device_data["status"] = 1
+            self.device_data["brightness"] = brightness or 255
+            self._cached_is_on = True
+            self._cached_brightness = brightness or 255
+            self.async_write_ha_state()
+
+    async def _flush_dim(self) -> None:
+        """Send the most recent pending brightness once the burst settles."""
+        await asyncio.sleep(DIM_DEBOUNCE_SECONDS)
+
+        brightness = self._pending_brightness
+        self._pending_brightness = None
+        if brightness is None:
+            return
+
+        ctx = self._get_command_ctx()
+        if ctx is None:
+            return
+        mesh_id, sector_uuid, control_urls = ctx
+
+        brightness_percent = _BRIGHTNESS_TO_PCT[brightness]
+        try:
+            client = self.coordinator.config_entry.runtime_data.client
+            await client.async_dim_light(
+                control_url_data=control_urls,
+                sector_uuid=sector_uuid,
+                mesh_id=mesh_id,
+                brightness_percent=brightness_percent,
+            )
+        except SGSmartApiClientError as exc:
+            _LOGGER.warning("Failed to dim light %s: %s", self._attr_name, exc)
 
+    async def async_turn_off(self, **_: Any) -> None:
+        """Turn off the dimmer."""
+        ctx = self._get_command_ctx()
+        if ctx is None:
+            return
+        mesh_id, sector_uuid, control_urls = ctx
+
+        # Drop any debounced dim still waiting to flush, or it would
+        # fire after the off command and re-light the bulb
+        self._pending_brightness = None
+        if self._dim_task is not None and not self._dim_task.done():
+            self._dim_task.cancel()
+
+        try:
+            client = self.coordinator.config_entry.runtime_data.client
+            await client.async_turn_off_light(
+                control_url_data=control_urls,
+                sector_uuid=sector_uuid,
+                mesh_id=mesh_id,
+            )
+        except SGSmartApiClientError as exc:
+            _LOGGER.warning("Failed to turn off light %s: %s", self._attr_name, exc)
+
+        # Optimistic update; the next scheduled poll reconciles
         if self.device_data:
             self.device_data["on"] = False
+            self.device_data["status"] = 0
+            self._cached_is_on = False
+            self.async_write_ha_state()
@@ -12,6 +12,7 @@ Usage:
 import asyncio
 import os
 import sys
+import time
 
 import aiohttp
 
@@ -60,9 +61,28 @@ async def test_api_client() -> None:
 
             # Test getting data - uses cookies for authentication
             print("Testing data retrieval...")
+            start = time.perf_counter()
             data = await client.async_get_devices()
             print(f"Data: {data}")
 
+            # Fetch control URLs for all sectors concurrently instead of
+            # one sequential round-trip per sector
+            sector_uuids = [
+                sector["uuid"]
+                for sector in (data or {}).get("sectors", [])
+                if isinstance(sector, dict) and "uuid" in sector
+            ]
+            if sector_uuids:
+                print(f"Fetching control URLs for {len(sector_uuids)} sector(s)...")
+                control_urls = await asyncio.gather(
+                    *[client.async_get_control_urls(uuid) for uuid in sector_uuids]
+                )
+                for uuid, urls in zip(sector_uuids, control_urls, strict=True):
+                    print(f"Control URLs for {uuid}: {urls}")
+
+            elapsed = time.perf_counter() - start
+            print(f"Full sync took {elapsed:.2f}s")
+
         except SGSmartApiClientAuthenticationError as e:
             print(f"Authentication error: {e}")
         except SGSmartApiClientCommunicationError as e: